@@ -2,44 +2,34 @@
 Global system configuration (singleton).
 """
 
+from dataclasses import dataclass, field
+from typing import ClassVar, Optional
 
+
+@dataclass(frozen=True, slots=True)
 class SystemConfig:
     """
     Singleton class for system-wide configuration.
 
     Ensures that only one configuration instance
     exists throughout the application lifecycle.
+    The dataclass is frozen, so values cannot be
+    modified after initialization.
     """
 
-    _instance = None
-    _frozen = False
+    # Core system settings (fixed; not constructor arguments)
+    buffer_size: int = field(default=100, init=False)
+    max_sensors: int = field(default=50, init=False)
+    anomaly_threshold: float = field(default=2.5, init=False)
+    poll_interval: float = field(default=0.5, init=False)  # seconds
+
+    _instance: ClassVar[Optional["SystemConfig"]] = None
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            cls._instance = object.__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
-        """
-        Initialize configuration values once.
-        """
-        if self._frozen:
-            return
-
-        # Core system settings
-        self.buffer_size = 100
-        self.max_sensors = 50
-        self.anomaly_threshold = 2.5
-        self.poll_interval = 0.5  # seconds
-
-        # Freeze configuration after initialization
-        self._frozen = True
-
-    def __setattr__(self, key, value):
-        """
-        Prevent modification of configuration
-        after initialization.
-        """
-        if getattr(self, "_frozen", False):
-            raise AttributeError("SystemConfig is immutable.")
-        super().__setattr__(key, value)
+
+# Shared configuration instance
+config = SystemConfig()
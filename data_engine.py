@@ -4,51 +4,60 @@ Async utilities for collecting sensor data.
 
 import asyncio
 import random
-from typing import List, Dict, Generator
+from typing import List, Dict, Generator, Optional
 
-from sensor import Sensor
+from sensor import Sensor, SHARED_RNG, reading_stream
 
 
 # Generator
 
-def sensor_stream() -> Generator[float, None, None]:
+def sensor_stream(chunk: int = 1024) -> Generator[float, None, None]:
     """
     Infinite generator simulating live sensor data.
+
+    Each call returns a new generator; values are drawn from
+    the shared sensor RNG in chunks.
     """
-    while True:
-        yield random.uniform(0.0, 100.0)
+    return reading_stream(chunk)
 
 
-# Async Readers
+# Collectors
 
-async def read_sensor(
-    sensor: Sensor,
+def _collect_once_sync(
+    sensors: List[Sensor],
     stream: Generator[float, None, None],
-) -> float:
+) -> Dict[str, float]:
     """
-    Read a single data point from a sensor asynchronously,
-    pulling values from a shared generator.
+    Collect one reading from each simulated sensor without asyncio.
     """
-    await asyncio.sleep(random.uniform(0.01, 0.05))
-    return next(stream)
+    return {sensor.name: next(stream) for sensor in sensors}
 
 
-async def collect_once(sensors: List[Sensor]) -> Dict[str, float]:
+async def collect_once(
+    sensors: List[Sensor],
+    stream: Optional[Generator[float, None, None]] = None,
+) -> Dict[str, float]:
     """
-    Collect one reading from each sensor concurrently.
+    Collect one reading from each sensor.
+
+    Sensors with real I/O share a single latency wait and are
+    then read synchronously; simulated sensors are read from
+    the stream without touching the event loop.
     """
-    stream = sensor_stream()
+    if stream is None:
+        stream = sensor_stream()
 
-    tasks = [
-        read_sensor(sensor, stream)
-        for sensor in sensors
-    ]
+    if not any(sensor.has_real_io for sensor in sensors):
+        return _collect_once_sync(sensors, stream)
 
-    results = await asyncio.gather(*tasks)
+    # One timer per iteration instead of one per sensor
+    await asyncio.sleep(random.uniform(0.01, 0.05))
 
     return {
-        sensor.name: value
-        for sensor, value in zip(sensors, results)
+        sensor.name: (
+            sensor.read_data_nowait() if sensor.has_real_io else next(stream)
+        )
+        for sensor in sensors
     }
 
 
@@ -56,14 +65,36 @@ async def sensor_loop(
     sensors: List[Sensor],
     iterations: int,
     delay: float = 0.0,
+    simulate: bool = True,
 ) -> List[Dict[str, float]]:
     """
     Run concurrent sensor reads for a fixed number of iterations.
+
+    When simulate is True and no sensor performs real I/O,
+    all readings are drawn in a single vectorized call.
+    Otherwise readings are collected one iteration at a time,
+    waiting once per iteration for sensors with real I/O.
     """
     snapshots: List[Dict[str, float]] = []
 
+    if simulate and not any(sensor.has_real_io for sensor in sensors):
+        names = [sensor.name for sensor in sensors]
+        readings = SHARED_RNG.uniform(
+            0.0, 100.0, (max(iterations, 0), len(sensors))
+        )
+
+        for row in readings.tolist():
+            snapshots.append(dict(zip(names, row)))
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        return snapshots
+
+    stream = sensor_stream()
+
     for _ in range(iterations):
-        snapshot = await collect_once(sensors)
+        snapshot = await collect_once(sensors, stream)
         snapshots.append(snapshot)
 
         if delay > 0:
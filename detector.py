@@ -3,9 +3,78 @@ Anomaly detection logic using interchangeable strategies.
 """
 
 import abc
+import math
 import numpy as np
 from typing import Iterable
 
+from jit import njit, NUMBA_AVAILABLE
+
+
+# Compiled Kernels
+
+@njit(cache=True)
+def _zscore_anomaly(x, threshold):
+    """
+    Return True as soon as a value exceeds the z-score threshold.
+
+    Computes the mean, then the variance from deviations about
+    the mean (numerically stable for offset data), then scans
+    for the first outlier without allocating intermediate arrays.
+    """
+    n = x.shape[0]
+    s = 0.0
+    for i in range(n):
+        s += x[i]
+    mean = s / n
+
+    ss = 0.0
+    for i in range(n):
+        d = x[i] - mean
+        ss += d * d
+    var = ss / n
+    if var <= 0:
+        return False
+
+    lim = threshold * math.sqrt(var)
+    for i in range(n):
+        if abs(x[i] - mean) > lim:
+            return True
+    return False
+
+
+@njit(cache=True)
+def _threshold_any(x, lo, hi):
+    """
+    Return True as soon as a value falls outside [lo, hi].
+    """
+    for i in range(x.shape[0]):
+        v = x[i]
+        if v < lo or v > hi:
+            return True
+    return False
+
+
+if NUMBA_AVAILABLE:
+    # Warm-start compilation so the first batch is not penalized
+    _zscore_anomaly(np.zeros(1, dtype=np.float64), 1.0)
+    _threshold_any(np.zeros(1, dtype=np.float64), 0.0, 1.0)
+
+
+def _as_float_array(data: Iterable[float]) -> np.ndarray:
+    """
+    Convert input data to a float64 array without an intermediate list.
+
+    NumPy arrays are used as-is when they are already float64
+    and flattened to 1-D so the compiled and NumPy paths see
+    the same shape; sized inputs (lists, dict views) are
+    allocated exactly once.
+    """
+    if isinstance(data, np.ndarray):
+        return np.asarray(data, dtype=np.float64).reshape(-1)
+
+    count = len(data) if hasattr(data, "__len__") else -1
+    return np.fromiter(data, dtype=np.float64, count=count)
+
 
 class DetectionStrategy(abc.ABC):
     """
@@ -29,18 +98,23 @@ class ZScoreStrategy(DetectionStrategy):
         self.threshold = threshold
 
     def detect(self, data: Iterable[float]) -> bool:
-        values = np.array(list(data))
+        values = _as_float_array(data)
 
         if values.size == 0:
             return False
 
-        std = values.std()
-        if std == 0:
+        if NUMBA_AVAILABLE:
+            return bool(_zscore_anomaly(values, self.threshold))
+
+        # Deviations about the mean keep the variance stable for
+        # offset data and are reused for the z-scores
+        deviations = values - values.mean()
+        variance = np.dot(deviations, deviations) / values.size
+        if variance <= 0:
             return False
 
-        mean = values.mean()
-        z_scores = np.abs((values - mean) / std)
-        return np.any(z_scores > self.threshold)
+        z_scores = np.abs(deviations) / np.sqrt(variance)
+        return bool(np.any(z_scores > self.threshold))
 
 
 class ThresholdStrategy(DetectionStrategy):
@@ -53,13 +127,20 @@ class ThresholdStrategy(DetectionStrategy):
         self.max_value = max_value
 
     def detect(self, data: Iterable[float]) -> bool:
-        values = np.array(list(data))
+        values = _as_float_array(data)
 
         if values.size == 0:
             return False
 
-        return np.any(
-            (values < self.min_value) | (values > self.max_value)
+        if NUMBA_AVAILABLE:
+            return bool(
+                _threshold_any(
+                    values, float(self.min_value), float(self.max_value)
+                )
+            )
+
+        return bool(
+            np.any((values < self.min_value) | (values > self.max_value))
         )
 
 
@@ -32,7 +32,7 @@ class SensorFactory:
             raise ValueError("Sensor type must be a non-empty string.")
 
         normalized = sensor_type.strip().lower()
-        registry = SensorRegistryMeta.get_registry()
+        registry = SensorRegistryMeta.registry_view()
 
         if normalized not in registry:
             valid = ", ".join(registry.keys())
@@ -10,10 +10,11 @@ import timeit
 from functools import wraps
 import weakref
 import gc
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import numpy as np
 
+from jit import njit, NUMBA_AVAILABLE
 from sensor import Sensor
 
 
@@ -37,6 +38,22 @@ def profile_execution(func):
     return wrapper
 
 
+# Compiled Kernels
+
+@njit(cache=True)
+def _jit_stats(x):
+    """
+    Single-pass Welford mean and standard deviation.
+    """
+    mean = 0.0
+    m2 = 0.0
+    for i in range(x.shape[0]):
+        delta = x[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x[i] - mean)
+    return mean, np.sqrt(m2 / x.shape[0])
+
+
 # Sensor Cache
 
 class SensorCache:
@@ -79,7 +96,31 @@ class DataProcessor:
 
     def __init__(self, batch_size: int = 100) -> None:
         self.batch_size = batch_size
-        self._buffer: List[float] = []
+        self._buffer: np.ndarray = np.empty(batch_size, dtype=np.float64)
+        self._idx = 0
+        self._last_batch: np.ndarray = self._buffer[:0]
+
+    @property
+    def last_batch_array(self) -> np.ndarray:
+        """
+        The readings reduced by the most recent process_batch call.
+
+        This is a view into the internal buffer, valid until
+        new readings are added.
+        """
+        return self._last_batch
+
+    def _grow(self, min_capacity: int) -> None:
+        """
+        Enlarge the preallocated buffer, keeping buffered readings.
+
+        Only needed when callers keep adding readings past
+        the batch size without processing the batch.
+        """
+        capacity = max(min_capacity, 2 * self._buffer.size)
+        buffer = np.empty(capacity, dtype=np.float64)
+        buffer[:self._idx] = self._buffer[:self._idx]
+        self._buffer = buffer
 
     def add_reading(self, value: float) -> bool:
         """
@@ -88,14 +129,33 @@ class DataProcessor:
         Returns:
             True if the batch size is reached.
         """
-        self._buffer.append(value)
-        return len(self._buffer) >= self.batch_size
+        if self._idx >= self._buffer.size:
+            self._grow(self._idx + 1)
+
+        self._buffer[self._idx] = value
+        self._idx += 1
+        return self._idx >= self.batch_size
+
+    def add_readings(self, values: np.ndarray) -> bool:
+        """
+        Add a block of sensor readings to the buffer in one copy.
+
+        Returns:
+            True if the batch size is reached.
+        """
+        end = self._idx + values.size
+        if end > self._buffer.size:
+            self._grow(end)
+
+        self._buffer[self._idx:end] = values
+        self._idx = end
+        return self._idx >= self.batch_size
 
     # Slow Python Implementation
 
     @staticmethod
     def slow_python_stats(values: List[float]) -> Tuple[float, float]:
-        """Slow Python implementation used for comparison."""
+        """Pure Python baseline used for profiling comparisons."""
         if not values:
             raise ValueError("Values list cannot be empty.")
 
@@ -103,6 +163,26 @@ class DataProcessor:
         variance = sum((x - mean) ** 2 for x in values) / len(values)
         return mean, variance ** 0.5
 
+    # JIT-compiled Implementation
+
+    @staticmethod
+    def jit_stats(values: Iterable[float]) -> Tuple[float, float]:
+        """
+        Numba-compiled counterpart of slow_python_stats.
+
+        Runs the same reduction as a single Welford pass;
+        falls back to NumPy when numba is not installed.
+        """
+        data = np.asarray(values, dtype=np.float64)
+        if data.size == 0:
+            raise ValueError("Values list cannot be empty.")
+
+        if NUMBA_AVAILABLE:
+            mean, std = _jit_stats(data)
+        else:
+            mean, std = data.mean(), data.std()
+        return float(mean), float(std)
+
     # Optimized NumPy Implementation
 
     @profile_execution
@@ -116,13 +196,15 @@ class DataProcessor:
         Raises:
             ValueError: If no data is available for processing.
         """
-        if not self._buffer:
+        if self._idx == 0:
             raise ValueError("No data available to process.")
 
-        data = np.array(self._buffer, dtype=np.float64)
+        data = self._buffer[:self._idx]
 
         mean = data.mean()
         std = data.std()
 
-        self._buffer.clear()
+        # Reuse the preallocated buffer for the next batch
+        self._last_batch = data
+        self._idx = 0
         return mean, std
@@ -2,8 +2,8 @@
 Sensor registry metaclass to auto-register sensor implementations.
 """
 
-import inspect
-from typing import Dict, Type
+import types
+from typing import Dict, Mapping, Type
 from abc import ABCMeta
 
 
@@ -21,7 +21,7 @@ class SensorRegistryMeta(ABCMeta):
         cls = super().__new__(mcls, name, bases, namespace)
 
         # Register only concrete (non-abstract) classes
-        if not inspect.isabstract(cls):
+        if not getattr(cls, "__abstractmethods__", None):
             sensor_name = getattr(cls, "SENSOR_NAME", None)
 
             # Prefer logical sensor name if available
@@ -39,3 +39,15 @@ class SensorRegistryMeta(ABCMeta):
             Dictionary mapping sensor names to sensor classes.
         """
         return dict(mcls._registry)
+
+    @classmethod
+    def registry_view(mcls) -> Mapping[str, Type]:
+        """
+        Return a read-only live view of the sensor class registry.
+
+        Unlike get_registry, no copy is made.
+
+        Returns:
+            Read-only mapping of sensor names to sensor classes.
+        """
+        return types.MappingProxyType(mcls._registry)
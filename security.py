@@ -2,27 +2,81 @@
 Security helpers: hashing, encryption, and safe file handling.
 """
 
+import atexit
 import hashlib
 import os
-from typing import Union
+import re
+from functools import lru_cache
+from io import BufferedWriter
+from typing import Dict, Iterable, List, Sequence, Union
 
 from cryptography.fernet import Fernet
 
 
 # Hashing
 
-def compute_sha256(data: Union[str, bytes]) -> str:
+def compute_sha256_bytes(
+    data: Union[str, bytes, bytearray, memoryview],
+) -> bytes:
     """
-    Compute a SHA-256 hash for the given data payload.
+    Compute the raw 32-byte SHA-256 digest for internal use.
+
+    Buffers (bytes, bytearray, memoryview) are hashed in
+    place without copying.
     """
     if isinstance(data, str):
         data = data.encode("utf-8")
 
+    return hashlib.sha256(data).digest()
+
+
+def compute_sha256(data: Union[str, bytes, bytearray, memoryview]) -> str:
+    """
+    Compute a SHA-256 hash for the given data payload.
+    """
+    return compute_sha256_bytes(data).hex()
+
+
+def compute_sha256_parts(*parts: Union[bytes, bytearray, memoryview]) -> str:
+    """
+    Compute a SHA-256 hash over the concatenation of parts
+    without building the concatenated buffer.
+    """
     hasher = hashlib.sha256()
-    hasher.update(data)
+    for part in parts:
+        hasher.update(part)
     return hasher.hexdigest()
 
 
+def compute_sha256_many(messages: Iterable[bytes]) -> List[str]:
+    """
+    Compute SHA-256 hex digests for many independent payloads.
+    """
+    sha256 = hashlib.sha256
+    return [sha256(message).hexdigest() for message in messages]
+
+
+class PrefixedHasher:
+    """
+    SHA-256 hasher for payloads sharing a fixed prefix.
+
+    The prefix is hashed once; each digest clones the
+    primed state and only processes the variable tail.
+    """
+
+    def __init__(self, prefix: bytes) -> None:
+        self._base = hashlib.sha256()
+        self._base.update(prefix)
+
+    def digest(self, tail: bytes) -> bytes:
+        """
+        Return the raw SHA-256 digest of prefix + tail.
+        """
+        hasher = self._base.copy()
+        hasher.update(tail)
+        return hasher.digest()
+
+
 # Encryption
 
 def generate_key() -> bytes:
@@ -32,24 +86,48 @@ def generate_key() -> bytes:
     return Fernet.generate_key()
 
 
-def encrypt_alert(message: str, key: bytes) -> bytes:
+@lru_cache(maxsize=4)
+def _get_fernet(key: bytes) -> Fernet:
+    """
+    Return a cached Fernet instance for the given key.
+
+    Avoids re-parsing the key on every encrypt/decrypt call.
+    """
+    return Fernet(key)
+
+
+def encrypt_alert(message: Union[str, bytes], key: bytes) -> bytes:
     """
     Encrypt a sensitive alert message.
+
+    Already-encoded bytes messages are encrypted as-is.
     """
-    fernet = Fernet(key)
-    return fernet.encrypt(message.encode("utf-8"))
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+
+    return _get_fernet(key).encrypt(message)
 
 
 def decrypt_alert(token: bytes, key: bytes) -> str:
     """
     Decrypt an encrypted alert message.
     """
-    fernet = Fernet(key)
-    return fernet.decrypt(token).decode("utf-8")
+    return _get_fernet(key).decrypt(token).decode("utf-8")
 
 
 # Secure File Handling
 
+_FORBIDDEN_FILENAME_CHARS = re.compile(
+    "["
+    + re.escape(os.sep)
+    + (re.escape(os.altsep) if os.altsep else "")
+    + "\x00]"
+)
+
+# Open log handles reused across save_secure_log calls
+_log_handles: Dict[str, BufferedWriter] = {}
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename to prevent directory traversal attacks.
@@ -59,29 +137,105 @@ def sanitize_filename(filename: str) -> str:
     if not filename or not filename.strip():
         raise ValueError("Filename must be a non-empty string.")
 
-    # Reject path separators explicitly
-    if (
-        os.path.sep in filename
-        or (os.path.altsep and os.path.altsep in filename)
-    ):
+    # Reject path separators and NUL bytes in a single scan
+    if _FORBIDDEN_FILENAME_CHARS.search(filename):
         raise ValueError("Invalid filename: path separators detected.")
 
-    sanitized = os.path.basename(filename)
+    # Reject Windows drive-relative names such as "C:file"
+    if len(filename) >= 2 and filename[1] == ":":
+        raise ValueError("Invalid filename: drive letter detected.")
+
+    return filename
+
+
+def _append_log(path: str, payload: bytes) -> None:
+    """
+    Append payload to the shared handle for an absolute path.
 
-    if sanitized != filename:
-        raise ValueError("Invalid filename: directory traversal detected.")
+    The handle stays open across calls, but every payload is
+    flushed immediately so written alerts survive a SIGTERM.
+    """
+    file = _log_handles.get(path)
+    if file is None:
+        file = _log_handles[path] = open(path, "ab")
 
-    return sanitized
+    file.write(payload)
+    file.flush()
 
 
-def save_secure_log(filename: str, data: bytes) -> None:
+def save_secure_log(
+    filename: str,
+    data: Union[bytes, Sequence[bytes]],
+) -> None:
     """
     Safely save encrypted data to a log file.
+
+    Accepts a single entry or a sequence of entries. The file
+    handle is kept open across calls and shared with
+    SecureLogWriter; entries are flushed on every call.
     """
-    if not isinstance(data, bytes):
+    entries = [data] if isinstance(data, bytes) else list(data)
+    if not all(isinstance(entry, bytes) for entry in entries):
         raise TypeError("Log data must be bytes.")
 
     safe_name = sanitize_filename(filename)
+    _append_log(
+        os.path.abspath(safe_name),
+        b"".join(entry + b"\n" for entry in entries),
+    )
+
+
+def flush_secure_logs() -> None:
+    """
+    Flush all open log handles to disk.
+    """
+    for file in _log_handles.values():
+        file.flush()
+
+
+@atexit.register
+def _close_secure_logs() -> None:
+    """
+    Close all open log handles at interpreter exit.
+    """
+    while _log_handles:
+        _, file = _log_handles.popitem()
+        file.close()
+
+
+class SecureLogWriter:
+    """
+    Append-only writer for encrypted log entries.
+
+    Writes through the same open handle as save_secure_log,
+    so entries from both stay in order. The file is only opened
+    on the first write, and each entry is flushed as it is
+    written. Closing the writer (or leaving its context)
+    closes the handle.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self._path = os.path.abspath(sanitize_filename(filename))
+
+    def write(self, data: bytes) -> None:
+        """
+        Append one encrypted entry to the log.
+        """
+        if not isinstance(data, bytes):
+            raise TypeError("Log data must be bytes.")
+
+        _append_log(self._path, data + b"\n")
+
+    def close(self) -> None:
+        """
+        Close the underlying log file.
+        """
+        file = _log_handles.pop(self._path, None)
+        if file is not None:
+            file.close()
+
+    def __enter__(self) -> "SecureLogWriter":
+        return self
 
-    with open(safe_name, "ab") as file:
-        file.write(data + b"\n")
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -6,9 +6,41 @@ import abc
 import asyncio
 import random
 from collections.abc import Generator
+
+import numpy as np
+
 from registry import SensorRegistryMeta
 
 
+# Shared Reading Stream
+
+# Random generator behind every simulated reading
+SHARED_RNG = np.random.default_rng()
+
+# Number of readings drawn per RNG call
+READING_BATCH_SIZE = 4096
+
+
+def reading_stream(
+    batch_size: int = READING_BATCH_SIZE,
+) -> Generator[float, None, None]:
+    """
+    Yield an infinite stream of simulated readings.
+
+    Readings are drawn from SHARED_RNG in NumPy batches and
+    converted to Python floats once per batch.
+
+    Yields:
+        float: Random sensor value.
+    """
+    while True:
+        yield from SHARED_RNG.uniform(0.0, 100.0, batch_size).tolist()
+
+
+# Process-wide stream read by every simulated sensor
+SHARED_STREAM = reading_stream()
+
+
 class Sensor(abc.ABC, metaclass=SensorRegistryMeta):
     """
     Base class for all sensor types.
@@ -17,6 +49,12 @@ class Sensor(abc.ABC, metaclass=SensorRegistryMeta):
     and calibration behavior.
     """
 
+    # Fixed attribute layout; __weakref__ keeps SensorCache working
+    __slots__ = ("name", "_calibrated", "__weakref__")
+
+    # Whether reads hit real hardware rather than a simulation
+    has_real_io = False
+
     def __init__(self, name: str) -> None:
         """
         Initialize the sensor with its logical name.
@@ -26,7 +64,6 @@ class Sensor(abc.ABC, metaclass=SensorRegistryMeta):
         """
         self.name = name
         self._calibrated = False
-        self._stream: Generator[float, None, None] = self._sensor_stream()
 
     @abc.abstractmethod
     async def read_data(self) -> float:
@@ -56,44 +93,36 @@ class Sensor(abc.ABC, metaclass=SensorRegistryMeta):
                 "before reading data."
             )
 
-    def _sensor_stream(self) -> Generator[float, None, None]:
+    def read_data_nowait(self) -> float:
         """
-        Yield an infinite stream of simulated readings.
+        Read one sensor value without simulated I/O latency.
 
-        Yields:
-            float: Random sensor value.
+        Lets callers that already waited once (e.g. a batch
+        of sensors) collect readings synchronously.
         """
-        while True:
-            yield random.uniform(0.0, 100.0)
+        self._ensure_calibrated()
+        return self._safe_read()
 
-    async def _safe_read(self) -> float:
+    def _safe_read(self) -> float:
         """
-        Safely read from the sensor stream with edge-case handling.
+        Read the next value from the shared sensor stream.
+
+        The stream is infinite and only yields floats, so no
+        per-read validation is needed outside debug builds.
 
         Returns:
-            float: Valid sensor reading or safe fallback value.
+            float: Sensor reading.
         """
-        try:
-            value = next(self._stream)
-
-            if value is None or not isinstance(value, (int, float)):
-                raise ValueError("Invalid sensor reading")
-
-            return float(value)
-
-        except StopIteration:
-            # Stream unexpectedly exhausted
-            return 0.0
-
-        except Exception as exc:
-            # Catch-all to avoid crashing async pipeline
-            print(f"[{self.__class__.__name__} Error] {exc}")
-            return 0.0
+        value = next(SHARED_STREAM)
+        assert isinstance(value, float), "Invalid sensor reading"
+        return value
 
 
 class TempSensor(Sensor):
     """Temperature sensor implementation."""
 
+    __slots__ = ()
+
     SENSOR_NAME = "temperature"
 
     def __init__(self) -> None:
@@ -102,7 +131,7 @@ class TempSensor(Sensor):
     async def read_data(self) -> float:
         self._ensure_calibrated()
         await asyncio.sleep(random.uniform(0.01, 0.05))
-        return await self._safe_read()
+        return self._safe_read()
 
     def calibrate(self) -> None:
         self._calibrated = True
@@ -111,6 +140,8 @@ class TempSensor(Sensor):
 class PressureSensor(Sensor):
     """Pressure sensor implementation."""
 
+    __slots__ = ()
+
     SENSOR_NAME = "pressure"
 
     def __init__(self) -> None:
@@ -119,7 +150,7 @@ class PressureSensor(Sensor):
     async def read_data(self) -> float:
         self._ensure_calibrated()
         await asyncio.sleep(random.uniform(0.01, 0.05))
-        return await self._safe_read()
+        return self._safe_read()
 
     def calibrate(self) -> None:
         self._calibrated = True
@@ -128,6 +159,8 @@ class PressureSensor(Sensor):
 class VibrationSensor(Sensor):
     """Vibration sensor implementation."""
 
+    __slots__ = ()
+
     SENSOR_NAME = "vibration"
 
     def __init__(self) -> None:
@@ -136,7 +169,7 @@ class VibrationSensor(Sensor):
     async def read_data(self) -> float:
         self._ensure_calibrated()
         await asyncio.sleep(random.uniform(0.01, 0.05))
-        return await self._safe_read()
+        return self._safe_read()
 
     def calibrate(self) -> None:
         self._calibrated = True
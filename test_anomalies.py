@@ -26,15 +26,25 @@ from sensor import Sensor, TempSensor, PressureSensor, VibrationSensor
 from registry import SensorRegistryMeta
 from factory import SensorFactory
 from config import SystemConfig
+import detector
 from detector import AnomalyDetector, ZScoreStrategy, ThresholdStrategy
-from data_engine import sensor_loop
+import data_engine
+from data_engine import collect_once, sensor_loop
+import processor
 from processor import DataProcessor, SensorCache
 from security import (
     compute_sha256,
+    compute_sha256_bytes,
     generate_key,
     encrypt_alert,
     decrypt_alert,
     sanitize_filename,
+    save_secure_log,
+    _close_secure_logs,
+    SecureLogWriter,
+    compute_sha256_many,
+    compute_sha256_parts,
+    PrefixedHasher,
 )
 
 # OOP & Design Tests
@@ -54,6 +64,14 @@ def test_sensor_registry_auto_register():
     assert VibrationSensor in registry.values()
 
 
+def test_sensor_registry_view_is_read_only():
+    """registry_view exposes the live registry without allowing writes."""
+    view = SensorRegistryMeta.registry_view()
+    assert view["temperature"] is TempSensor
+    with pytest.raises(TypeError):
+        view["fake"] = TempSensor
+
+
 def test_sensor_factory_creation():
     """SensorFactory creates proper sensor instances from type strings."""
     temp = SensorFactory.create_sensor("temperature")
@@ -64,6 +82,20 @@ def test_sensor_factory_creation():
     assert isinstance(vibration, VibrationSensor)
 
 
+def test_sensor_factory_follows_registry_updates():
+    """SensorFactory builds the class currently registered for a type."""
+    original = SensorRegistryMeta.registry_view()["temperature"]
+
+    class ReplacementTempSensor(TempSensor):
+        __slots__ = ()
+
+    try:
+        sensor = SensorFactory.create_sensor("temperature")
+        assert type(sensor) is ReplacementTempSensor
+    finally:
+        SensorRegistryMeta._registry["temperature"] = original
+
+
 def test_systemconfig_singleton_only():
     """SystemConfig enforces singleton behavior."""
     config1 = SystemConfig()
@@ -71,6 +103,15 @@ def test_systemconfig_singleton_only():
     assert config1 is config2  # Singleton
 
 
+def test_systemconfig_is_immutable():
+    """SystemConfig values cannot be changed after creation."""
+    config = SystemConfig()
+    with pytest.raises(AttributeError):
+        config.buffer_size = 10
+    with pytest.raises(TypeError):
+        SystemConfig(buffer_size=10)
+
+
 def test_anomaly_detector_strategy_switch_zscore():
     """AnomalyDetector with ZScoreStrategy detects anomalies correctly."""
     detector = AnomalyDetector(strategy=ZScoreStrategy(threshold=1.0))
@@ -78,6 +119,38 @@ def test_anomaly_detector_strategy_switch_zscore():
     assert detector.detect(data)
 
 
+def test_zscore_detects_outlier_on_large_offset():
+    """ZScoreStrategy stays accurate when readings share a large offset."""
+    detector = AnomalyDetector(strategy=ZScoreStrategy(threshold=2.5))
+    data = 1e6 + 0.001 * np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 40])
+    assert detector.detect(data)
+    assert not detector.detect(1e6 + 0.001 * np.arange(1, 11))
+
+
+@pytest.mark.parametrize("use_kernel", [True, False])
+def test_zscore_flattens_multidimensional_input(monkeypatch, use_kernel):
+    """ZScoreStrategy treats 2-D input as flat data on both code paths."""
+    monkeypatch.setattr(detector, "NUMBA_AVAILABLE", use_kernel)
+    strategy = ZScoreStrategy(threshold=1.0)
+    result = strategy.detect(np.array([[1.0, 2.0], [3.0, 100.0]]))
+    assert result is True
+
+
+@pytest.mark.parametrize("use_kernel", [True, False])
+def test_threshold_flattens_multidimensional_input(monkeypatch, use_kernel):
+    """ThresholdStrategy treats 2-D input as flat data on both code paths."""
+    monkeypatch.setattr(detector, "NUMBA_AVAILABLE", use_kernel)
+    strategy = ThresholdStrategy(min_value=0, max_value=50)
+    assert strategy.detect(np.array([[10.0, 20.0], [30.0, 60.0]])) is True
+    assert strategy.detect(np.array([[10.0, 20.0], [30.0, 40.0]])) is False
+
+
+def test_zscore_nan_input_is_not_flagged():
+    """ZScoreStrategy does not report an anomaly for NaN input."""
+    detector = AnomalyDetector(strategy=ZScoreStrategy(threshold=1.0))
+    assert not detector.detect([1.0, float("nan"), 3.0])
+
+
 def test_anomaly_detector_strategy_switch_threshold():
     """AnomalyDetector with ThresholdStrategy detects anomalies correctly."""
     detector = AnomalyDetector(
@@ -107,6 +180,15 @@ async def test_async_sensor_read_data(async_calibrated_temp_sensor):
     assert isinstance(value, float)
 
 
+def test_sensor_read_data_nowait_requires_calibration():
+    """read_data_nowait enforces calibration and returns a float."""
+    sensor = PressureSensor()
+    with pytest.raises(RuntimeError):
+        sensor.read_data_nowait()
+    sensor.calibrate()
+    assert isinstance(sensor.read_data_nowait(), float)
+
+
 @pytest.mark.asyncio
 async def test_sensor_loop_multiple_sensors():
     """sensor_loop collects multiple async readings correctly."""
@@ -118,6 +200,47 @@ async def test_sensor_loop_multiple_sensors():
     for snap in snapshots:
         assert all(isinstance(v, float) for v in snap.values())
 
+
+@pytest.mark.asyncio
+async def test_sensor_loop_without_simulation():
+    """sensor_loop without simulation collects one iteration at a time."""
+    sensors = [TempSensor(), VibrationSensor()]
+    for s in sensors:
+        s.calibrate()
+    snapshots = await sensor_loop(sensors, iterations=2, simulate=False)
+    assert len(snapshots) == 2
+    for snap in snapshots:
+        assert set(snap) == {"Temperature", "Vibration"}
+        assert all(0.0 <= v <= 100.0 for v in snap.values())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("simulate", [True, False])
+async def test_sensor_loop_negative_iterations(simulate):
+    """sensor_loop returns no snapshots for negative iterations."""
+    sensors = [TempSensor()]
+    sensors[0].calibrate()
+    assert await sensor_loop(sensors, iterations=-1, simulate=simulate) == []
+
+
+@pytest.mark.asyncio
+async def test_collect_once_waits_once_for_real_io(monkeypatch):
+    """collect_once sleeps once per iteration for real-I/O sensors."""
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(data_engine.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(TempSensor, "has_real_io", True)
+    sensors = [TempSensor(), TempSensor(), PressureSensor()]
+    for s in sensors:
+        s.calibrate()
+    snapshot = await collect_once(sensors)
+    assert len(sleeps) == 1
+    assert set(snapshot) == {"Temperature", "Pressure"}
+    assert all(isinstance(v, float) for v in snapshot.values())
+
 # Data Processing & Memory
 
 
@@ -131,6 +254,51 @@ def test_data_processor_buffer_and_batch():
     assert abs(std - np.std([0, 1, 2, 3, 4])) < 1e-6
 
 
+def test_data_processor_stats_on_large_offset():
+    """process_batch std stays accurate for readings with a large offset."""
+    values = 1e6 + 0.001 * np.arange(10, dtype=np.float64)
+    processor = DataProcessor(batch_size=10)
+    processor.add_readings(values)
+    (_, std), _ = processor.process_batch()
+    assert abs(std - np.std(values)) < 1e-9
+
+
+def test_data_processor_add_readings_bulk():
+    """DataProcessor accepts a block of readings in a single call."""
+    processor = DataProcessor(batch_size=4)
+    assert not processor.add_readings(np.array([1.0, 2.0]))
+    assert processor.add_readings(np.array([3.0, 4.0, 5.0]))
+    (mean, std), _ = processor.process_batch()
+    assert abs(mean - 3.0) < 1e-6
+    assert abs(std - np.std([1, 2, 3, 4, 5])) < 1e-6
+
+
+def test_data_processor_exposes_last_batch():
+    """DataProcessor exposes the last processed batch as a float array."""
+    processor = DataProcessor(batch_size=3)
+    for value in (1.0, 2.0, 3.0):
+        processor.add_reading(value)
+    processor.process_batch()
+    batch = processor.last_batch_array
+    assert batch.dtype == np.float64
+    assert batch.tolist() == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.parametrize("use_kernel", [True, False])
+def test_jit_stats_matches_slow_python_stats(monkeypatch, use_kernel):
+    """jit_stats agrees with the pure Python reference implementation."""
+    monkeypatch.setattr(processor, "NUMBA_AVAILABLE", use_kernel)
+    values = [float(v) for v in range(1, 101)]
+    mean_jit, std_jit = DataProcessor.jit_stats(values)
+    mean_py, std_py = DataProcessor.slow_python_stats(values)
+    assert abs(mean_jit - mean_py) < 1e-6
+    assert abs(std_jit - std_py) < 1e-6
+
+    # NaN input propagates like the reference implementation
+    mean_nan, std_nan = DataProcessor.jit_stats([1.0, float("nan"), 3.0])
+    assert np.isnan(mean_nan) and np.isnan(std_nan)
+
+
 def test_sensor_cache_weakref():
     """SensorCache weak references release sensors after deletion."""
     cache = SensorCache()
@@ -153,6 +321,31 @@ def test_sha256_hash():
     assert digest == expected
 
 
+def test_sha256_many_matches_single():
+    """compute_sha256_many matches compute_sha256 for each payload."""
+    messages = [b"a", b"b", b"sensor"]
+    assert compute_sha256_many(messages) == [
+        compute_sha256(m) for m in messages
+    ]
+
+
+def test_sha256_buffers_and_parts():
+    """compute_sha256 hashes buffers in place; parts hash as one payload."""
+    expected = hashlib.sha256(b"sensor-data").hexdigest()
+    assert compute_sha256(memoryview(b"sensor-data")) == expected
+    assert compute_sha256(bytearray(b"sensor-data")) == expected
+    assert compute_sha256_parts(b"sensor-", b"data") == expected
+    assert compute_sha256_bytes(b"sensor-data").hex() == expected
+
+
+def test_prefixed_hasher_matches_full_hash():
+    """PrefixedHasher digests equal hashing prefix and tail together."""
+    hasher = PrefixedHasher(b"Temperature:")
+    for tail in (b"12.5", b"99.0"):
+        expected = hashlib.sha256(b"Temperature:" + tail).digest()
+        assert hasher.digest(tail) == expected
+
+
 def test_encryption_round_trip():
     """Encrypted alerts can be decrypted to original message."""
     key = generate_key()
@@ -162,6 +355,13 @@ def test_encryption_round_trip():
     assert decrypted == message
 
 
+def test_encrypt_alert_accepts_bytes():
+    """encrypt_alert accepts pre-encoded bytes messages."""
+    key = generate_key()
+    encrypted = encrypt_alert(b"Critical Alert!", key)
+    assert decrypt_alert(encrypted, key) == "Critical Alert!"
+
+
 def test_sanitize_filename_valid():
     """sanitize_filename allows valid filenames."""
     safe_name = sanitize_filename("log.txt")
@@ -173,6 +373,58 @@ def test_sanitize_filename_blocks_traversal():
     with pytest.raises(ValueError):
         sanitize_filename("../../etc/passwd")
 
+
+@pytest.mark.parametrize(
+    "filename", ["logs/alerts.log", "C:alerts.log", "a\x00b"]
+)
+def test_sanitize_filename_rejects_path_components(filename):
+    """Names that os.path.basename would alter are all rejected."""
+    with pytest.raises(ValueError):
+        sanitize_filename(filename)
+
+
+@pytest.fixture
+def close_secure_logs():
+    """Close the shared log handles opened during a test."""
+    yield
+    _close_secure_logs()
+
+
+def test_secure_log_writer_appends_entries(tmp_path, monkeypatch):
+    """SecureLogWriter appends one line per entry to a single open file."""
+    monkeypatch.chdir(tmp_path)
+    with SecureLogWriter("alerts.log") as writer:
+        writer.write(b"first")
+        writer.write(b"second")
+    assert (tmp_path / "alerts.log").read_bytes() == b"first\nsecond\n"
+
+
+def test_secure_log_writer_opens_lazily(tmp_path, monkeypatch):
+    """SecureLogWriter does not create the log until an entry is written."""
+    monkeypatch.chdir(tmp_path)
+    with SecureLogWriter("alerts.log"):
+        pass
+    assert not (tmp_path / "alerts.log").exists()
+
+
+def test_secure_log_writer_shares_handle_with_save_secure_log(
+    tmp_path, monkeypatch, close_secure_logs
+):
+    """Entries from save_secure_log and SecureLogWriter stay in order."""
+    monkeypatch.chdir(tmp_path)
+    save_secure_log("ordered.log", b"first")
+    with SecureLogWriter("ordered.log") as writer:
+        writer.write(b"second")
+    assert (tmp_path / "ordered.log").read_bytes() == b"first\nsecond\n"
+
+
+def test_save_secure_log_batch(tmp_path, monkeypatch, close_secure_logs):
+    """save_secure_log flushes a batch of entries in order."""
+    monkeypatch.chdir(tmp_path)
+    save_secure_log("alerts.log", [b"one", b"two"])
+    save_secure_log("alerts.log", b"three")
+    assert (tmp_path / "alerts.log").read_bytes() == b"one\ntwo\nthree\n"
+
 # Performance Tests
 
 